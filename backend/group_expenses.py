@@ -1,5 +1,19 @@
+import numpy as np
 import pandas as pd
 
+NS_PER_HOUR = 3600 * 10**9
+
+
+def _to_ns(dates: pd.Series) -> np.ndarray:
+    """int64 nanosecond timestamps (NaT -> min int64)."""
+    return dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _to_cents(amounts: pd.Series) -> np.ndarray:
+    """Whole cents as int64, so balances never drift from float error."""
+    return np.rint(amounts.to_numpy(dtype=np.float64) * 100).astype(np.int64)
+
+
 def detect_group_expenses(
     df: pd.DataFrame,
     is_reimbursement_col: str = 'is_reimbursement',
@@ -10,7 +24,10 @@ def detect_group_expenses(
 ) -> tuple[pd.DataFrame, list[dict]]:
     """
     Matches reimbursements to their specific tagged group expenses.
-    
+
+    Matching runs on parallel arrays (int64 timestamps, integer cents);
+    results go into preallocated columns and the output is built once.
+
     Returns:
       matched: DataFrame of clear matches
       ambiguous: list of dicts with { transaction, possibleGroups }
@@ -20,59 +37,115 @@ def detect_group_expenses(
     reimbs = df[df[is_reimbursement_col] & (df[amount_col] > 0)].copy()
     exps   = df[df[is_group_col]        & (df[amount_col] < 0)].copy()
 
-
-
     # Make sure each row has a unique ID
     if 'id' not in df.columns:
         df["id"] = df.index.astype(str)
         reimbs["id"] = reimbs.index.astype(str)
 
-    exps['remaining'] = -exps[amount_col]  # Flip to positive remaining
-
-    reimb_list = reimbs.sort_values(date_col).to_dict('records')
-    exp_list   = exps.sort_values(date_col).to_dict('records')
-
-    matched_rows = []
-    ambiguous_rows = []
-
-    for r in reimb_list:
-        candidates = [
-            e for e in exp_list
-            if 0 <= (r[date_col] - e[date_col]).total_seconds() <= window_hours * 3600
-            and e['remaining'] >= r[amount_col]
-        ]
-        if len(candidates) == 1:
-            e = candidates[0]
-            applied = r[amount_col]
-            e['remaining'] -= applied
-            matched_rows.append({
-                'id': r['id'],
-                'description': r['description'],
-                'amount': r[amount_col],
-                'category': 'Reimbursement',
-                'confidence': 1.0,
-                'is_group': False,
-                'is_reimbursement': True,
-                'reimb_date': r[date_col].date(),
-                'expense_date': e[date_col].date(),
-                'expense_desc': e['description'],
-                'original_amt': -e[amount_col],
-                'applied_amt': applied,
-                'remaining_amt': e['remaining']
-            })
+    reimbs = reimbs.sort_values(date_col)
+    exps   = exps.sort_values(date_col)  # NaT sorts last
+
+    # Reimbursement columns
+    r_ts    = _to_ns(reimbs[date_col])
+    r_cents = _to_cents(reimbs[amount_col])
+    r_valid = ~reimbs[date_col].isna().to_numpy()
+
+    # Expense columns; amounts owed as positive cents
+    e_ts        = _to_ns(exps[date_col])
+    e_cents     = -_to_cents(exps[amount_col])
+    e_desc      = exps['description'].to_numpy()
+    n_dated     = int(exps[date_col].notna().sum())
+    e_ts_dated  = e_ts[:n_dated]
+
+    # Window bounds for every reimbursement, computed in one pass
+    window = window_hours * NS_PER_HOUR
+    lo_idx = np.searchsorted(e_ts_dated, r_ts - window, side='left')
+    hi_idx = np.searchsorted(e_ts_dated, r_ts, side='right')
+
+    # Plain lists keep the loop free of per-element numpy scalars
+    r_need    = r_cents.tolist()
+    r_ok      = r_valid.tolist()
+    lo_list   = lo_idx.tolist()
+    hi_list   = hi_idx.tolist()
+    remaining = e_cents.tolist()  # balance still owed, updated in place
+
+    # Preallocated result columns
+    n = len(r_need)
+    m_reimb     = [0] * n
+    m_exp       = [0] * n
+    m_remaining = [0] * n
+    n_matched = 0
+    amb_reimb = [0] * n
+    amb_start = [0] * (n + 1)
+    amb_exp   = []  # flat candidate indices, sliced by amb_start
+    n_amb = 0
+
+    for i in range(n):
+        need  = r_need[i]
+        found = -1
+        count = 0
+        if r_ok[i]:
+            for j in range(lo_list[i], hi_list[i]):
+                if remaining[j] >= need:
+                    found = j
+                    count += 1
+                    if count > 1:
+                        break
+        if count == 1:
+            remaining[found] -= need
+            m_reimb[n_matched]     = i
+            m_exp[n_matched]       = found
+            m_remaining[n_matched] = remaining[found]
+            n_matched += 1
         else:
-            ambiguous_rows.append({
-                "transaction": {
-                    "id": r['id'],
-                    "description": r['description'],
-                    "amount": r[amount_col],
-                    "category": "Reimbursement",
-                    "confidence": 1.0,
-                    "is_group": False,
-                    "is_reimbursement": True,
-                },
-                "possibleGroups": [e['description'] for e in candidates]
-            })
-
-    matched = pd.DataFrame(matched_rows)
+            amb_reimb[n_amb] = i
+            amb_start[n_amb] = len(amb_exp)
+            if count:
+                amb_exp.extend(
+                    j for j in range(lo_list[i], hi_list[i])
+                    if remaining[j] >= need
+                )
+            n_amb += 1
+    amb_start[n_amb] = len(amb_exp)
+
+    m_reimb     = np.array(m_reimb[:n_matched], dtype=np.intp)
+    m_exp       = np.array(m_exp[:n_matched], dtype=np.intp)
+    m_remaining = np.array(m_remaining[:n_matched], dtype=np.int64)
+
+    matched = pd.DataFrame({
+        'id': reimbs['id'].to_numpy()[m_reimb],
+        'description': reimbs['description'].to_numpy()[m_reimb],
+        'amount': r_cents[m_reimb] / 100,
+        'category': 'Reimbursement',
+        'confidence': 1.0,
+        'is_group': False,
+        'is_reimbursement': True,
+        'reimb_date': pd.DatetimeIndex(reimbs[date_col].to_numpy()[m_reimb]).date,
+        'expense_date': pd.DatetimeIndex(exps[date_col].to_numpy()[m_exp]).date,
+        'expense_desc': e_desc[m_exp],
+        'original_amt': e_cents[m_exp] / 100,
+        'applied_amt': r_cents[m_reimb] / 100,
+        'remaining_amt': m_remaining / 100,
+    }) if n_matched else pd.DataFrame()
+
+    r_id   = reimbs['id'].tolist()
+    r_desc = reimbs['description'].tolist()
+    r_amts = (r_cents / 100).tolist()
+    e_desc_list = e_desc.tolist()
+    ambiguous_rows = [
+        {
+            "transaction": {
+                "id": r_id[i],
+                "description": r_desc[i],
+                "amount": r_amts[i],
+                "category": "Reimbursement",
+                "confidence": 1.0,
+                "is_group": False,
+                "is_reimbursement": True,
+            },
+            "possibleGroups": [e_desc_list[j] for j in amb_exp[amb_start[k]:amb_start[k + 1]]]
+        }
+        for k, i in enumerate(amb_reimb[:n_amb])
+    ]
+
     return matched, ambiguous_rows
@@ -0,0 +1,103 @@
+"""
+Benchmark for detect_group_expenses.
+
+Reports wall time, peak traced memory and allocations per reimbursement
+on a synthetic statement.
+
+Run from the repo root:
+    python -m benchmarks.bench_group_expenses [n_transactions]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from backend.group_expenses import detect_group_expenses
+
+
+def make_transactions(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        rng.integers(0, 365 * 24, n), unit="h"
+    )
+    amounts = np.round(rng.uniform(5, 200, n), 2)
+    is_reimb = rng.random(n) < 0.4
+    amounts = np.where(is_reimb, np.round(amounts / 4, 2), -amounts)
+    return pd.DataFrame({
+        "date": dates,
+        "description": [f"txn {i}" for i in range(n)],
+        "amount": amounts,
+        "is_reimbursement": is_reimb,
+        "is_group": ~is_reimb & (rng.random(n) < 0.02),
+    })
+
+
+def count_allocations(fn, *args) -> int:
+    """
+    Counts memory blocks allocated while fn runs, including ones freed
+    again before it returns.
+
+    Every opcode executed in fn's module is traced, and each rise in
+    sys.getallocatedblocks() between two opcodes is added up. Calls into
+    other modules (pandas, numpy) count as a single step, so only the
+    blocks they leave alive are included.
+    """
+    filename = fn.__code__.co_filename
+    total = 0
+    last = 0
+
+    def step(frame, event, arg):
+        nonlocal total, last
+        now = sys.getallocatedblocks()
+        if now > last:
+            total += now - last
+        # -1: `now` and the old `last` are freed once this returns
+        last = sys.getallocatedblocks() - 1
+        return step
+
+    def enter(frame, event, arg):
+        if frame.f_code.co_filename != filename:
+            return None
+        frame.f_trace_opcodes = True
+        return step
+
+    gc.disable()
+    sys.settrace(enter)
+    try:
+        last = sys.getallocatedblocks()
+        fn(*args)
+    finally:
+        sys.settrace(None)
+        gc.enable()
+    return total
+
+
+def run(n: int) -> None:
+    df = make_transactions(n)
+    n_reimbs = int((df["is_reimbursement"] & (df["amount"] > 0)).sum())
+
+    start = time.perf_counter()
+    detect_group_expenses(df.copy())
+    elapsed = time.perf_counter() - start
+
+    frame = df.copy()
+    tracemalloc.start()
+    result = detect_group_expenses(frame)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    allocs = count_allocations(detect_group_expenses, df.copy())
+
+    print(f"transactions:          {n}")
+    print(f"reimbursements:        {n_reimbs}")
+    print(f"matched / ambiguous:   {len(result[0])} / {len(result[1])}")
+    print(f"time:                  {elapsed * 1000:.1f} ms")
+    print(f"peak memory:           {peak / 1024:.1f} KiB")
+    print(f"allocations / reimb:   {allocs / max(n_reimbs, 1):.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
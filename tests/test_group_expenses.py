@@ -0,0 +1,115 @@
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from backend.group_expenses import detect_group_expenses
+
+
+def make_df(rows):
+    """rows: (date, description, amount) — positive is a reimbursement, negative a group expense."""
+    df = pd.DataFrame(rows, columns=['date', 'description', 'amount'])
+    df['is_reimbursement'] = df['amount'] > 0
+    df['is_group'] = df['amount'] < 0
+    return df
+
+
+def test_single_match_reduces_remaining():
+    df = make_df([
+        ('2024-01-01 10:00', 'WALMART', -90.00),
+        ('2024-01-02 10:00', 'ZELLE FROM JANE', 30.00),
+    ])
+    matched, ambiguous = detect_group_expenses(df)
+
+    assert ambiguous == []
+    assert len(matched) == 1
+    row = matched.iloc[0]
+    assert row['expense_desc'] == 'WALMART'
+    assert row['original_amt'] == 90.00
+    assert row['applied_amt'] == 30.00
+    assert row['remaining_amt'] == 60.00
+
+
+def test_two_candidates_are_ambiguous():
+    df = make_df([
+        ('2024-01-01 09:00', 'WALMART', -50.00),
+        ('2024-01-01 12:00', 'TARGET', -40.00),
+        ('2024-01-02 10:00', 'ZELLE FROM JANE', 20.00),
+    ])
+    matched, ambiguous = detect_group_expenses(df)
+
+    assert matched.empty
+    assert len(ambiguous) == 1
+    assert ambiguous[0]['transaction']['description'] == 'ZELLE FROM JANE'
+    assert sorted(ambiguous[0]['possibleGroups']) == ['TARGET', 'WALMART']
+
+
+def test_window_edges_are_inclusive():
+    same_time = make_df([
+        ('2024-01-01 10:00', 'WALMART', -50.00),
+        ('2024-01-01 10:00', 'ZELLE FROM JANE', 20.00),
+    ])
+    matched, _ = detect_group_expenses(same_time)
+    assert len(matched) == 1
+
+    at_limit = make_df([
+        ('2024-01-01 10:00', 'WALMART', -50.00),
+        ('2024-01-03 10:00', 'ZELLE FROM JANE', 20.00),
+    ])
+    matched, _ = detect_group_expenses(at_limit, window_hours=48)
+    assert len(matched) == 1
+
+    past_limit = make_df([
+        ('2024-01-01 10:00', 'WALMART', -50.00),
+        ('2024-01-03 10:01', 'ZELLE FROM JANE', 20.00),
+    ])
+    matched, ambiguous = detect_group_expenses(past_limit, window_hours=48)
+    assert matched.empty
+    assert ambiguous[0]['possibleGroups'] == []
+
+
+def test_reimbursement_before_expense_does_not_match():
+    df = make_df([
+        ('2024-01-01 09:00', 'ZELLE FROM JANE', 20.00),
+        ('2024-01-01 10:00', 'WALMART', -50.00),
+    ])
+    matched, ambiguous = detect_group_expenses(df)
+    assert matched.empty
+    assert ambiguous[0]['possibleGroups'] == []
+
+
+def test_unparseable_dates_never_match():
+    df = make_df([
+        ('2024-01-01 10:00', 'WALMART', -50.00),
+        ('not a date', 'ZELLE FROM JANE', 20.00),
+    ])
+    matched, ambiguous = detect_group_expenses(df)
+    assert matched.empty
+    assert ambiguous[0]['possibleGroups'] == []
+
+    df = make_df([
+        ('not a date', 'TARGET', -40.00),
+        ('2024-01-01 10:00', 'WALMART', -50.00),
+        ('2024-01-02 10:00', 'ZELLE FROM JANE', 20.00),
+    ])
+    matched, ambiguous = detect_group_expenses(df)
+    assert ambiguous == []
+    assert matched.iloc[0]['expense_desc'] == 'WALMART'
+
+
+def test_cents_do_not_drift():
+    # In floats 0.30 - 0.10 - 0.10 < 0.10, which would leave the third unmatched
+    df = make_df([
+        ('2024-01-01 10:00', 'WALMART', -0.30),
+        ('2024-01-01 11:00', 'ZELLE FROM A', 0.10),
+        ('2024-01-01 12:00', 'ZELLE FROM B', 0.10),
+        ('2024-01-01 13:00', 'ZELLE FROM C', 0.10),
+    ])
+    matched, ambiguous = detect_group_expenses(df)
+
+    assert ambiguous == []
+    assert matched['remaining_amt'].tolist() == [0.20, 0.10, 0.00]
+    assert (matched['original_amt'] - matched['remaining_amt']).round(2).tolist() == [0.10, 0.20, 0.30]